@@ -1,11 +1,27 @@
 #!/usr/bin/env python
 
-from distutils.core import setup
+from distutils.core import setup, Extension
 from catkin_pkg.python_setup import generate_distutils_setup
 
+# Compiles the step pulse extension if Cython is available. The extension
+# is optional, so a failure to cythonize or compile it (e.g. without a C
+# compiler or the Python headers) keeps the Python implementation
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize([
+        Extension(
+            "gpr20_axis.stepper_core",
+            ["src/gpr20_axis/stepper_core.pyx"],
+            optional=True
+        )
+    ])
+except Exception:
+    ext_modules = []
+
 setup_args = generate_distutils_setup(
   packages=["gpr20_axis"],
-  package_dir={"": "src"}
+  package_dir={"": "src"},
+  ext_modules=ext_modules
 )
 
 setup(**setup_args)
@@ -15,8 +15,37 @@
 
 """Axis driver for the GPR-20 robot."""
 
+import functools
+import itertools
+import types
+
+import numpy as np
+
 from gpr20_axis.stepper_interface import StepperInterface
 from gpr20_axis.endstop_interface import EndstopInterface
+from gpr20_axis.wave_interface import WaveInterface
+
+# Steps between each current coordinate update during a movement
+COORD_UPDATE_STEPS = 64
+
+# Minimum steps of a movement to use the hardware-timed interface
+WAVE_MIN_STEPS = 100
+
+# Source of the step by step movement loop, filled with the axis constants
+_RUN_MOVE_TEMPLATE = """
+def _run_move(self, n_steps, start_coord, coord_delta):
+    if n_steps < {ramp_steps!r}:
+        pauses = repeat({max_step!r}, n_steps)
+    else:
+        pauses = chain(
+            {accel!r},
+            repeat({min_step!r}, n_steps - {ramp_steps!r}),
+            {decel!r})
+    for executed_steps, pause_val in enumerate(pauses, 1):
+        pulse(pause_val)
+        if not executed_steps % {update_steps!r}:
+            self.current_coord = start_coord + coord_delta * executed_steps
+"""
 
 
 class AxisDriver(object):
@@ -35,6 +64,8 @@ class AxisDriver(object):
             sensor).
         stepper_interface (StepperInterface): stepper motor hardware interface
             for the axis driver.
+        wave_interface (WaveInterface): hardware-timed stepper motor interface
+            for long movements. It is None if pigpio is not available.
         sensor_pin (int): sensor pin number for the endstop sensor data line.
             It must lie within 1 and 40. Con not be equal to any other pin
             value (step and dir).
@@ -65,6 +96,15 @@ class AxisDriver(object):
         busy (bool): tells if axis is busy.
     """
 
+    # Declares the instance attributes to avoid a per-instance dictionary
+    __slots__ = (
+        "_dir_pin", "_step_pin", "_stepper_interface", "_wave_interface",
+        "_step_size", "_min_step", "_max_step", "_delta_step",
+        "_step_intervals", "_min_coord", "_max_coord", "_axis_type",
+        "_sensor_pin", "_endstop_interface", "current_coord", "homing_done",
+        "__busy", "_run_move"
+    )
+
     def __init__(self, pin_values, step_values, coord_values, axis_type):
         """Initialize the axis driver class.
 
@@ -106,6 +146,14 @@ class AxisDriver(object):
             self._dir_pin,
             self._step_pin)
 
+        # Initializes the hardware-timed motor interface if available
+        try:
+            self._wave_interface = WaveInterface(
+                self._dir_pin,
+                self._step_pin)
+        except (OSError, IOError):
+            self._wave_interface = None
+
         # Stores the attributes for step values
         self._step_size = step_values[0]
         self._min_step, self._max_step = step_values[1], step_values[2]
@@ -145,14 +193,17 @@ class AxisDriver(object):
             self._sensor_pin, self._endstop_interface = None, None
 
         # Initializes the current coordinate attribute
-        self._current_coord = -1.0
+        self.current_coord = -1.0
 
         # Initializes the homing done attribute
-        self._homing_done = False
+        self.homing_done = False
 
         # Intializes the busy attribute
         self.__busy = False
 
+        # Generates the step by step movement loop for this axis
+        self._run_move = self._build_run_move()
+
     def homing(self):
         """Perform the homing sequence for the axis.
 
@@ -175,51 +226,69 @@ class AxisDriver(object):
         if self._axis_type == 'ROT':
 
             # Initializes the current coordinate to minimum coordinate
-            self._current_coord = self._min_coord
+            self.current_coord = self._min_coord
 
             # Set homing attribute
-            self._homing_done = True
+            self.homing_done = True
 
         # Executes homing sequence for linear axis
         else:
 
             # Calculates the maximum steps that can be performed on axis
-            max_steps = (self._max_coord - self._min_coord) / self._step_size
-
-            # Creates a stop variable for sequence
-            reached_sensor = False
+            max_steps = int(
+                (self._max_coord - self._min_coord) / self._step_size)
 
             # Creates a counter
             executed_steps = 0
 
-            # Homing sequence runs on a loop until
-            while not reached_sensor:
+            # Binds the loop invariants to locals to avoid lookups per step
+            pulse = self._stepper_interface.pulse
+            reached_sensor = self._endstop_interface.reached
+            max_step = self._max_step
 
-                # Executes an step on negative direction at minimum speed
-                self._stepper_interface.step(False, self._max_step)
+            # Sets the negative direction for the whole sequence
+            self._stepper_interface.set_direction(False)
 
-                # Increments the step count
-                executed_steps += 1
+            # Homing sequence runs on a loop until sensor is asserted
+            try:
 
-                # Checks sensor value
-                reached_sensor = self._endstop_interface.sample()
+                # Starts detecting the sensor assertion
+                self._endstop_interface.arm()
 
-                # Checks if maximum step have been achieved
-                if executed_steps == max_steps:
-                    raise AxisException(
-                        "Maximum steps for axis have been achieved")
+                while not reached_sensor():
+
+                    # Executes an step at minimum speed
+                    pulse(max_step)
+
+                    # Increments the step count
+                    executed_steps += 1
+
+                    # Checks if maximum step have been achieved
+                    if executed_steps >= max_steps:
+                        raise AxisException(
+                            "Maximum steps for axis have been achieved")
+
+            # Stops detecting the sensor assertion
+            finally:
+                self._endstop_interface.disarm()
 
             # Sets minimum coordinate value
-            self._current_coord = self._min_coord
+            self.current_coord = self._min_coord
 
             # Sets the homing attribute to true
-            self._homing_done = True
+            self.homing_done = True
 
     def move_to_coordinate(self, target_coord):
         """Move axis positioner to a target coordinate.
 
         Args:
             target_coord (float): target cooordinate for the axis positioner.
+
+        Raises:
+            AxisException: if axis is busy, homing has not been performed,
+                target coordinate is not valid or the hardware-timed
+                movement fails. A failed movement leaves the axis position
+                unknown, so homing must be performed again.
         """
         # Checks that axis is not busy
         self._check_availability()
@@ -233,32 +302,62 @@ class AxisDriver(object):
         # Checks that axis is within valid coordinates
         self._check_valid_target(target_coord)
 
+        # Stores the coordinate where the movement starts
+        start_coord = self.current_coord
+
         # Calculate the distance delta to target coordinate
-        distance_delta = self._calculate_delta_distance(target_coord)
+        distance_delta = start_coord - target_coord
 
         # Get the movement direction
-        move_direction = self._calculate_direction(distance_delta)
+        move_direction = distance_delta < 0
 
         # Get the required steps to reach target
-        n_steps = self._calculate_steps(distance_delta)
+        n_steps = int(abs(distance_delta) / self._step_size)
+
+        # Calculates the coordinate change for each step
+        coord_delta = self._step_size if move_direction else -self._step_size
+
+        # Releases the axis even if the movement fails
+        try:
+
+            # Executes long movements with hardware timing if available
+            if (self._wave_interface is not None
+                    and n_steps >= WAVE_MIN_STEPS):
+
+                # Updates the current coordinate value after each waveform
+                def update_coord(executed_steps):
+                    self.current_coord = (
+                        start_coord + coord_delta * executed_steps)
+
+                # Executes the axis movement
+                try:
+                    self._wave_interface.move(
+                        move_direction,
+                        n_steps,
+                        functools.partial(self._create_steps_list, n_steps),
+                        update_coord)
+
+                # Requires homing again since the position is unknown
+                except (OSError, IOError) as error:
+                    self.homing_done = False
+                    raise AxisException(
+                        "Hardware-timed movement failed: %s" % error)
 
-        # Get the step time list
-        steps_list = self._create_steps_list(n_steps)
+            # Executes the movement step by step otherwise
+            else:
 
-        # Executes the axis movement
-        for pause_val in steps_list:
+                # Sets the direction for the whole movement
+                self._stepper_interface.set_direction(move_direction)
 
-            # Moves the axis at the defined speed
-            self._stepper_interface.step(move_direction, pause_val)
+                # Executes the axis movement
+                self._run_move(n_steps, start_coord, coord_delta)
 
-            # Updates the current coordinate value
-            if move_direction:
-                self._current_coord += self._step_size
-            else:
-                self._current_coord -= self._step_size
+            # Sets the coordinate reached at the end of the movement
+            self.current_coord = start_coord + coord_delta * n_steps
 
         # Releases the axis
-        self.__busy = False
+        finally:
+            self.__busy = False
 
     def _check_availability(self):
         """Checks if axis is available."""
@@ -267,7 +366,7 @@ class AxisDriver(object):
 
     def _check_homing(self):
         """Checks if axis routine was performed."""
-        if not self._homing_done:
+        if not self.homing_done:
             self.__busy = False
             raise AxisException("Homing has not been performed!")
 
@@ -325,63 +424,90 @@ class AxisDriver(object):
         """
         return int(abs(distance_delta) / self._step_size)
 
-    def _create_steps_list(self, n_steps):
+    def _create_steps_list(self, n_steps, start=0, stop=None):
         """Calculate the duration of each step to move axis.
 
+        Only the steps between 'start' and 'stop' are calculated, so long
+        movements can be generated in chunks.
+
         Args:
             n_steps (int): step count to reach a target coordinate.
+            start (int): index of the first step to calculate.
+            stop (int): index after the last step to calculate. Defaults to
+                'n_steps'.
 
         Returns:
-            list: with time pauses for each step on axis movement.
+            numpy.ndarray: with time pauses for each step on axis movement.
         """
-        # Creates the steps times list
-        steps_list = []
+        # Calculates every step up to the end of the movement by default
+        if stop is None:
+            stop = n_steps
 
         # Moves at constant low speed if can not accelerate
-        if n_steps < 2 * self._step_intervals and n_steps > 0:
-            steps_list = [self._max_step for i in range(n_steps)]
-
-        # Acceleration and deceleration with no constant speed
-        elif n_steps == 2 * self._step_intervals:
-
-            # Defines the acceleration interval
-            for i in range(self._step_intervals):
-                steps_list.append(self._max_step - i * self._delta_step)
+        if n_steps < 2 * self._step_intervals:
+            return np.full(stop - start, self._max_step, dtype=np.float64)
 
-            # Defines the deceleration interval
-            for i in range(self._step_intervals):
-                steps_list.append(self._min_step + i * self._delta_step)
+        # Allocates the steps list and a buffer for the deceleration ramp
+        steps_list = np.empty(stop - start, dtype=np.float64)
+        decel = np.arange(start, stop, dtype=np.float64)
 
-        # Acceleration and deceleration with constant speed
-        elif n_steps > 2 * self._step_intervals:
+        # Defines the acceleration ramp over all steps
+        np.multiply(decel, -self._delta_step, out=steps_list)
+        steps_list += self._max_step
 
-            # Calculates how many constant speed steps are required
-            const_steps = n_steps - (2 * self._step_intervals)
+        # Defines the deceleration ramp over all steps
+        decel -= n_steps - self._step_intervals
+        decel *= self._delta_step
+        decel += self._min_step
 
-            # Defines the acceleration interval
-            for i in range(self._step_intervals):
-                steps_list.append(self._max_step - i * self._delta_step)
-
-            # Defines the constant speed interval
-            for i in range(const_steps):
-                steps_list.append(self._min_step)
-
-            # Defines the deceleration interval
-            for i in range(self._step_intervals):
-                steps_list.append(self._min_step + i * self._delta_step)
+        # Takes the slowest ramp for each step, bounded by the minimum step
+        np.maximum(steps_list, decel, out=steps_list)
+        np.maximum(steps_list, self._min_step, out=steps_list)
 
         # Returns the steps time list
         return steps_list
 
-    @property
-    def current_coord(self):
-        """Return the current axis coordinate."""
-        return self._current_coord
+    def _build_run_move(self):
+        """Generate the step by step movement loop for the axis.
 
-    @property
-    def homing_done(self):
-        """Return boolean flag with homing status."""
-        return self._homing_done
+        The step values of the axis are fixed after initialization, so the
+        loop is generated from '_RUN_MOVE_TEMPLATE' with the step time
+        ramps and limits as literals, which avoids loading them from the
+        instance on every movement.
+
+        Returns:
+            method: '_run_move(n_steps, start_coord, coord_delta)' bound to
+                the axis driver. It performs the steps in the current
+                direction and updates the current coordinate every
+                'COORD_UPDATE_STEPS' steps.
+        """
+        # Calculates the acceleration and deceleration step time ramps
+        ramp_index = np.arange(self._step_intervals)
+        accel = np.maximum(
+            self._max_step - ramp_index * self._delta_step,
+            self._min_step)
+        decel = self._min_step + ramp_index * self._delta_step
+
+        # Fills the template with the axis constants
+        source = _RUN_MOVE_TEMPLATE.format(
+            ramp_steps=2 * self._step_intervals,
+            min_step=self._min_step,
+            max_step=self._max_step,
+            accel=tuple(accel.tolist()),
+            decel=tuple(decel.tolist()),
+            update_steps=COORD_UPDATE_STEPS
+        )
+
+        # Compiles the loop with the names it depends on
+        namespace = {
+            "chain": itertools.chain,
+            "repeat": itertools.repeat,
+            "pulse": self._stepper_interface.pulse
+        }
+        exec(compile(source, "<axis_run_move>", "exec"), namespace)
+
+        # Binds the loop to the axis driver
+        return types.MethodType(namespace["_run_move"], self)
 
 
 class AxisException(Exception):
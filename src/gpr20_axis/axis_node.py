@@ -15,6 +15,8 @@
 
 """ROS node for axis driver for the GPR-20 robot."""
 
+import os
+
 import rospy
 import actionlib
 from std_srvs.srv import Empty, EmptyResponse
@@ -45,6 +47,10 @@ class AxisNode(object):
         # Initializes the GPR-20 axis node
         rospy.init_node("gpr20_axis", anonymous=False)
 
+        # Gets the scheduling parameters for the threads that drive the axis
+        self._cpu_core = rospy.get_param("~cpu_core", -1)
+        self._sched_priority = rospy.get_param("~sched_priority", 0)
+
         # Get the pin parameters
         pin_values = [
             rospy.get_param("~dir_pin"),
@@ -102,20 +108,60 @@ class AxisNode(object):
         # Creates the homing service
         rospy.Service("homing", Empty, self.homing_handler)
 
-        # Define the rate for the node to publish data
-        node_rate = rospy.Rate(100)
+        # Create the axis status message that is reused on every publish
+        self._axis_status_msg = GPR20AxisStatus()
 
-        # Execute the node publishers
-        while not rospy.is_shutdown():
+        # Publish the axis status at 100 Hz from a timer thread
+        self._axis_status_timer = rospy.Timer(
+            rospy.Duration(0.01),
+            self._publish_status
+        )
 
-            # Publish homing status and current coordinate
-            self._current_coord_pub.publish(
-                self._axis_driver.homing_done,
-                self._axis_driver.current_coord
-            )
+        # Keep the node running until shutdown
+        rospy.spin()
 
-            # Sleep the node to match node rate
-            node_rate.sleep()
+    def _publish_status(self, event):
+        """Publish the homing status and current coordinate of the axis.
+
+        Args:
+            event (rospy.TimerEvent): timing information of the timer call.
+        """
+        # Updates homing status and current coordinate
+        self._axis_status_msg.homing_done = self._axis_driver.homing_done
+        self._axis_status_msg.current_coord = self._axis_driver.current_coord
+
+        # Publish the axis status
+        self._current_coord_pub.publish(self._axis_status_msg)
+
+    def _configure_scheduling(self):
+        """Pin the calling thread to a CPU core and set a real-time priority.
+
+        On Linux both settings only apply to the calling thread, so they are
+        applied from the handlers that drive the axis. The status publisher
+        and the rest of the node threads keep the default scheduling and
+        are not starved by the step busy-wait. Both settings are optional
+        and disabled with a warning if the process lacks the permissions
+        to apply them.
+        """
+        # Pins the thread to the given CPU core
+        if self._cpu_core >= 0:
+            try:
+                os.sched_setaffinity(0, {self._cpu_core})
+            except OSError as error:
+                rospy.logwarn("Could not set CPU affinity: %s" % error)
+                self._cpu_core = -1
+
+        # Sets the real-time scheduling policy
+        if self._sched_priority > 0:
+            try:
+                os.sched_setscheduler(
+                    0,
+                    os.SCHED_FIFO,
+                    os.sched_param(self._sched_priority)
+                )
+            except OSError as error:
+                rospy.logwarn("Could not set SCHED_FIFO priority: %s" % error)
+                self._sched_priority = 0
 
     def homing_handler(self, srv):
         """Perform the homing routine for the axis.
@@ -125,6 +171,9 @@ class AxisNode(object):
                 sequence. The executed homing sequence depends on the axis
                 type.
         """
+        # Configures the thread scheduling for accurate step timing
+        self._configure_scheduling()
+
         # Tries to execute the homing routine
         try:
             # Commands driver to execute homing routine
@@ -146,6 +195,9 @@ class AxisNode(object):
             goal (AxisGoal): goal message for action. The goal includes the
                 target coordinate for the axis.
         """
+        # Configures the thread scheduling for accurate step timing
+        self._configure_scheduling()
+
         # Try to execute the requested goal
         try:
 
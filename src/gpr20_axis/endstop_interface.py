@@ -15,11 +15,12 @@
 
 """Endstop sensor interface class for the GPR-20 robot."""
 
-# Imports GPIO library
-try:
-    import RPi.GPIO as GPIO
-except ImportError:
-    from gpr20_axis.gpio_mock import GPIO
+# Imports the Python standard threading library
+import threading
+
+from gpr20_axis import gpio_common
+from gpr20_axis.gpio_registers import board_to_bcm, pin_mask
+from gpr20_axis.gpio_registers import GPLEV0
 
 
 class EndstopInterface(object):
@@ -44,11 +45,35 @@ class EndstopInterface(object):
         # Stores the sensor pin number as class attribute
         self._sensor_pin = sensor_pin
 
-        # Sets the board mode for GPIO handling
-        GPIO.setmode(GPIO.BOARD)
+        # Translates the pin to BCM numbering once
+        self._sensor_bcm = board_to_bcm(self._sensor_pin)
+
+        # Stores the GPIO library installed when the interface is created
+        self._gpio = gpio_common.GPIO
+
+        # Sets the BCM mode for GPIO handling
+        gpio_common.ensure_mode()
 
         # Sets up the pins as input
-        GPIO.setup(self._sensor_pin, GPIO.IN)
+        self._gpio.setup(self._sensor_bcm, self._gpio.IN)
+
+        # Creates the event that is set when sensor is asserted
+        self._asserted = threading.Event()
+        self._edge_detection = False
+
+        # Keeps the GPIO registers mapped to read the pin level directly
+        registers = gpio_common.map_registers()
+
+        # Falls back to the GPIO library if registers are not available
+        if registers is None:
+            self._sensor_lev = None
+
+        # Precomputes the level register view and the pin bit mask
+        else:
+            self._sensor_lev = registers.pin_register(
+                GPLEV0,
+                self._sensor_bcm)
+            self._sensor_mask = pin_mask(self._sensor_bcm)
 
     def sample(self):
         """Sample the endstop sensor value.
@@ -57,8 +82,79 @@ class EndstopInterface(object):
           bool: the logical value for endstop sensor. 'True' for pressed,
             'False' otherwise.
         """
+        # Reads the level register directly if it is mapped
+        if self._sensor_lev is not None:
+            return not self._sensor_lev.value & self._sensor_mask
+
         # Returns logic invertion of sampled pin value
-        return not GPIO.input(self._sensor_pin)
+        return not self._gpio.input(self._sensor_bcm)
+
+    def arm(self):
+        """Start detecting the endstop sensor assertion.
+
+        The sensor pin is watched for falling edges by the GPIO library, so
+        the sensor level only needs to be confirmed after an edge. If edge
+        detection is not available (e.g. on kernels without the sysfs GPIO
+        interface) the asserted event is kept set, so 'reached' samples the
+        sensor on every call.
+        """
+        # Clears any previous assertion
+        self._asserted.clear()
+
+        # Sets the event on the falling edge of the sensor pin
+        try:
+            self._gpio.add_event_detect(
+                self._sensor_bcm,
+                self._gpio.FALLING,
+                callback=self._edge_callback
+            )
+
+        # Falls back to sampling the sensor on every call
+        except RuntimeError:
+            self._edge_detection = False
+            self._asserted.set()
+
+        # Checks if sensor was already pressed
+        else:
+            self._edge_detection = True
+            if self.sample():
+                self._asserted.set()
+
+    def disarm(self):
+        """Stop detecting the endstop sensor assertion."""
+        if self._edge_detection:
+            self._gpio.remove_event_detect(self._sensor_bcm)
+            self._edge_detection = False
+
+    def reached(self):
+        """Check if the endstop sensor has been asserted since arming.
+
+        An edge is only accepted if the sensor is still pressed when this
+        method is called, so noise spikes do not count as an assertion.
+
+        Returns:
+          bool: 'True' if sensor is pressed after a detected edge, 'False'
+            otherwise.
+        """
+        # Returns early if no edge has been detected
+        if not self._asserted.is_set():
+            return False
+
+        # Consumes the edge before confirming it, so any later edge sets the
+        # event again instead of being discarded with a false trigger
+        if self._edge_detection:
+            self._asserted.clear()
+
+        # Confirms the edge with the sensor level
+        return self.sample()
+
+    def _edge_callback(self, channel):
+        """Set the asserted event from the GPIO library edge detection.
+
+        Args:
+            channel (int): GPIO channel that triggered the edge detection.
+        """
+        self._asserted.set()
 
     @property
     def sensor_pin(self):
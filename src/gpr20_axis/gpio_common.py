@@ -0,0 +1,87 @@
+# Copyright (C) 2021 Grupo de Desminado Humanitario (Uniandes)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""GPIO library setup shared by the GPR-20 axis hardware interfaces."""
+
+# Imports the GPIO library for Raspberry Pi 4
+try:
+    import RPi.GPIO as GPIO
+except ImportError:
+    from gpr20_axis.gpio_mock import GPIO
+
+from gpr20_axis.gpio_registers import GPIORegisters
+
+# Tells if the GPIO library mode has been set
+_mode_set = False
+
+# Tells if the interfaces may drive the pins without the GPIO library
+_direct_access = True
+
+
+def ensure_mode():
+    """Set up the GPIO library mode once for every interface.
+
+    Sets the BCM pin numbering and disables the library warnings. Calls
+    after the first one do nothing.
+    """
+    global _mode_set
+
+    # Sets up the library only on the first call
+    if not _mode_set:
+        GPIO.setwarnings(False)
+        GPIO.setmode(GPIO.BCM)
+        _mode_set = True
+
+
+def install(gpio):
+    """Replace the GPIO library used by the interfaces created afterwards.
+
+    Direct access to the pins (through the GPIO registers or the pigpio
+    daemon) is disabled, so every pin access of the new interfaces goes
+    through the installed library (e.g. a 'gpio_mock.FakeTimedGPIO'
+    recorder).
+
+    Args:
+        gpio (object): object providing the RPi.GPIO library interface.
+    """
+    global GPIO, _mode_set, _direct_access
+
+    # Replaces the library and sets its mode again on the next interface
+    GPIO = gpio
+    _mode_set = False
+    _direct_access = False
+
+
+def direct_access():
+    """Return 'True' if the interfaces may bypass the GPIO library."""
+    return _direct_access
+
+
+def map_registers():
+    """Map the GPIO registers if direct access to the pins is enabled.
+
+    Returns:
+        GPIORegisters: mapped GPIO registers, or 'None' if they are not
+            available or direct access has been disabled by 'install'.
+    """
+    # Leaves every pin access to the installed GPIO library
+    if not _direct_access:
+        return None
+
+    # Maps the registers if the device is available
+    try:
+        return GPIORegisters()
+    except (OSError, IOError):
+        return None
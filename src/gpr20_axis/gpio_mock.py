@@ -1,29 +1,113 @@
+"""GPIO library mock for running the axis driver without a Raspberry Pi."""
+
+import logging
+import time
+
+import numpy as np
+
+# Enables tracing of the GPIO calls through the module logger
+TRACE = False
+
+_logger = logging.getLogger(__name__)
+
+
+def _trace(message, *args):
+    """Log a GPIO call if debug logging is enabled."""
+    if _logger.isEnabledFor(logging.DEBUG):
+        _logger.debug(message, *args)
 
-import random
 
 class GPIO(object):
-    
+
     BOARD = 0
     BCM = 1
     IN = 2
     OUT = 3
+    RISING = 4
+    FALLING = 5
+    BOTH = 6
 
     def __init__(self):
         pass
 
     @staticmethod
     def setmode(mode):
-        print("Mode set on %s." % mode)
+        if TRACE:
+            _trace("Mode set on %s.", mode)
+
+    @staticmethod
+    def setwarnings(flag):
+        if TRACE:
+            _trace("Warnings set to %s.", flag)
 
     @staticmethod
     def setup(pin, mode):
-        print("Setting pin %d on mode %d" % (pin, mode))
+        if TRACE:
+            _trace("Setting pin %d on mode %d", pin, mode)
 
     @staticmethod
     def output(pin, value):
-        print("Pin %d output is set to %d" % (pin, value))
+        if TRACE:
+            _trace("Pin %d output is set to %d", pin, value)
 
     @staticmethod
     def input(pin):
         return False
 
+    @staticmethod
+    def add_event_detect(pin, edge, callback=None, bouncetime=None):
+        if TRACE:
+            _trace("Detecting edge %d on pin %d", edge, pin)
+
+    @staticmethod
+    def remove_event_detect(pin):
+        if TRACE:
+            _trace("Removing edge detection on pin %d", pin)
+
+
+class FakeTimedGPIO(GPIO):
+    """GPIO mock that records the time of every output write.
+
+    Writes are stored on preallocated arrays, so recording does not add
+    allocations to the step loop. Install an instance with
+    'gpr20_axis.gpio_common.install' before creating the axis driver, so
+    every pin write goes through the recorder instead of the GPIO
+    registers, and call 'reset' before a movement to check the step timing.
+
+    Attributes:
+        timestamps (numpy.ndarray): 'time.perf_counter_ns' value of each
+            recorded write.
+        pins (numpy.ndarray): BCM pin number of each recorded write.
+        values (numpy.ndarray): output value of each recorded write.
+        count (int): number of recorded writes.
+    """
+
+    def __init__(self, capacity):
+        """Allocate the recording arrays.
+
+        Args:
+            capacity (int): maximum number of writes to record. Further
+                writes are ignored.
+        """
+        super(FakeTimedGPIO, self).__init__()
+        self.reset(capacity)
+
+    def reset(self, capacity=None):
+        """Clear the recorded writes.
+
+        Args:
+            capacity (int): new maximum number of writes to record. The
+                current arrays are kept if it is not given.
+        """
+        if capacity is not None:
+            self.timestamps = np.zeros(capacity, np.int64)
+            self.pins = np.zeros(capacity, np.int16)
+            self.values = np.zeros(capacity, np.bool_)
+        self.count = 0
+
+    def output(self, pin, value):
+        if self.count < len(self.timestamps):
+            self.timestamps[self.count] = time.perf_counter_ns()
+            self.pins[self.count] = pin
+            self.values[self.count] = value
+            self.count += 1
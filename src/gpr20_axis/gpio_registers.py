@@ -0,0 +1,131 @@
+# Copyright (C) 2021 Grupo de Desminado Humanitario (Uniandes)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Memory-mapped GPIO registers for the Raspberry Pi 4 (BCM2711)."""
+
+import ctypes
+import mmap
+import os
+
+# Device exposing the GPIO block without requiring root access
+GPIOMEM_PATH = "/dev/gpiomem"
+
+# Size of the mapped GPIO register block
+BLOCK_SIZE = 4096
+
+# Byte offsets of the output set, output clear and pin level registers
+GPSET0 = 0x1C
+GPCLR0 = 0x28
+GPLEV0 = 0x34
+
+# Translation from Raspberry Pi 4 board numbering to BCM GPIO numbering
+BOARD_TO_BCM = {
+    3: 2, 5: 3, 7: 4, 8: 14, 10: 15, 11: 17, 12: 18, 13: 27, 15: 22,
+    16: 23, 18: 24, 19: 10, 21: 9, 22: 25, 23: 11, 24: 8, 26: 7, 27: 0,
+    28: 1, 29: 5, 31: 6, 32: 12, 33: 13, 35: 19, 36: 16, 37: 26, 38: 20,
+    40: 21
+}
+
+
+def board_to_bcm(pin):
+    """Translate a board pin number to its BCM GPIO number.
+
+    Args:
+        pin (int): pin number according to Raspberry Pi 4 board numbering.
+
+    Returns:
+        int: BCM GPIO number of the pin.
+
+    Raises:
+        ValueError: if the board pin is not a GPIO pin.
+    """
+    try:
+        return BOARD_TO_BCM[pin]
+    except KeyError:
+        raise ValueError("Board pin %s is not a GPIO pin" % pin)
+
+
+def pin_mask(bcm):
+    """Return the bit mask of a GPIO within its register bank.
+
+    Args:
+        bcm (int): BCM GPIO number.
+
+    Returns:
+        int: bit mask for the set, clear and level registers.
+    """
+    return 1 << (bcm % 32)
+
+
+class GPIORegisters(object):
+    """Direct access to the GPIO registers through '/dev/gpiomem'.
+
+    Writing the set and clear registers directly turns a pin toggle into a
+    single memory store, avoiding the GPIO library call on every edge. Pins
+    must still be configured (e.g. as outputs) using the GPIO library.
+
+    Attributes:
+        path (str): path of the GPIO memory device that has been mapped.
+    """
+
+    def __init__(self, path=GPIOMEM_PATH):
+        """Map the GPIO register block.
+
+        Args:
+            path (str): path of the GPIO memory device. Defaults to
+                '/dev/gpiomem'.
+
+        Raises:
+            OSError: if the GPIO memory device is not available or can not
+                be mapped.
+        """
+        # Stores the device path
+        self._path = path
+
+        # Opens the device and maps the register block
+        fd = os.open(self._path, os.O_RDWR | os.O_SYNC)
+        try:
+            self._mem = mmap.mmap(fd, BLOCK_SIZE)
+        finally:
+            os.close(fd)
+
+    def register(self, offset):
+        """Return a 32-bit view over the register at the given offset.
+
+        Args:
+            offset (int): byte offset of the register within the block.
+
+        Returns:
+            ctypes.c_uint32: view whose 'value' reads or writes the register.
+        """
+        return ctypes.c_uint32.from_buffer(self._mem, offset)
+
+    def pin_register(self, offset, bcm):
+        """Return a 32-bit view over the register bank of a GPIO.
+
+        Args:
+            offset (int): byte offset of the first register of the bank
+                (e.g. 'GPSET0').
+            bcm (int): BCM GPIO number.
+
+        Returns:
+            ctypes.c_uint32: view over the register holding the GPIO bit.
+        """
+        return self.register(offset + (bcm // 32) * 4)
+
+    @property
+    def path(self):
+        """Return the path of the mapped GPIO memory device."""
+        return self._path
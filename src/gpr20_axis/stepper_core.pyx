@@ -0,0 +1,104 @@
+# cython: language_level=3
+
+# Copyright (C) 2021 Grupo de Desminado Humanitario (Uniandes)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Compiled step pulse for the GPR-20 stepper motor interface."""
+
+from libc.stdint cimport uint32_t, uintptr_t
+
+from gpr20_axis.timing import SPIN_THRESHOLD, SLEEP_SLACK
+
+# Writes the GPIO registers and waits the pulse time in plain C, so these
+# helpers never check for Python exceptions while the GIL is released
+cdef extern from *:
+    """
+    #include <stdint.h>
+    #include <time.h>
+
+    static inline void gpr20_write_register(uintptr_t addr, uint32_t value)
+    {
+        *(volatile uint32_t *)addr = value;
+    }
+
+    static inline long long gpr20_now(void)
+    {
+        struct timespec ts;
+        clock_gettime(CLOCK_MONOTONIC, &ts);
+        return (long long)ts.tv_sec * 1000000000LL + ts.tv_nsec;
+    }
+
+    static inline void gpr20_precise_wait(long long pause_ns,
+                                          long long spin_threshold_ns,
+                                          long long sleep_slack_ns)
+    {
+        long long deadline = gpr20_now() + pause_ns;
+        long long sleep_ns;
+        struct timespec ts;
+
+        /* Sleeps most of the pause if it is long enough */
+        if (pause_ns > spin_threshold_ns) {
+            sleep_ns = pause_ns - sleep_slack_ns;
+            ts.tv_sec = sleep_ns / 1000000000LL;
+            ts.tv_nsec = sleep_ns % 1000000000LL;
+            nanosleep(&ts, NULL);
+        }
+
+        /* Busy-waits until the deadline */
+        while (gpr20_now() < deadline) {
+        }
+    }
+    """
+    void write_register "gpr20_write_register"(
+        uintptr_t addr, uint32_t value) nogil
+    void precise_wait "gpr20_precise_wait"(
+        long long pause_ns, long long spin_threshold_ns,
+        long long sleep_slack_ns) nogil
+
+# Precise wait parameters in nanoseconds
+cdef long long SPIN_THRESHOLD_NS = <long long>(SPIN_THRESHOLD * 1e9)
+cdef long long SLEEP_SLACK_NS = <long long>(SLEEP_SLACK * 1e9)
+
+
+def pulse(uintptr_t set_addr, uintptr_t clr_addr, uint32_t mask,
+          double pause_val):
+    """Perform a step pulse writing the GPIO registers directly.
+
+    The pulse runs without holding the GIL, so other threads can run while
+    it waits.
+
+    Args:
+        set_addr (int): address of the mapped set register of the step pin.
+        clr_addr (int): address of the mapped clear register of the step
+            pin.
+        mask (int): bit mask of the step pin.
+        pause_val (float): sets the pause time value for step. Pause value
+            must be defined in seconds.
+    """
+    cdef long long pause_ns = <long long>(pause_val * 1e9)
+
+    with nogil:
+
+        # Drives the output pin to high
+        write_register(set_addr, mask)
+
+        # Waits for signal to be asserted
+        precise_wait(pause_ns, SPIN_THRESHOLD_NS, SLEEP_SLACK_NS)
+
+        # Drives the output pin to low
+        write_register(clr_addr, mask)
+
+        # Waits for signal to be asserted
+        precise_wait(pause_ns, SPIN_THRESHOLD_NS, SLEEP_SLACK_NS)
@@ -15,15 +15,19 @@
 
 """Stepper motor interface for GPR-20 robot."""
 
-# Imports the Python standard time library
-import time
+import ctypes
+import functools
 
-# Imports the GPIO library for Raspberry Pi 4
+from gpr20_axis import gpio_common
+from gpr20_axis.timing import precise_wait
+from gpr20_axis.gpio_registers import board_to_bcm, pin_mask
+from gpr20_axis.gpio_registers import GPSET0, GPCLR0
+
+# Imports the compiled step pulse if the extension has been built
 try:
-    import RPi.GPIO as GPIO
-    
+    from gpr20_axis.stepper_core import pulse as core_pulse
 except ImportError:
-    from gpr20_axis.gpio_mock import GPIO
+    core_pulse = None
 
 
 class StepperInterface(object):
@@ -55,12 +59,44 @@ class StepperInterface(object):
         self._dir_pin = dir_pin
         self._step_pin = step_pin
 
-        # Sets the board mode for GPIO handling
-        GPIO.setmode(GPIO.BOARD)
+        # Translates the pins to BCM numbering once
+        self._dir_bcm = board_to_bcm(self._dir_pin)
+        self._step_bcm = board_to_bcm(self._step_pin)
+
+        # Stores the GPIO library installed when the interface is created
+        self._gpio = gpio_common.GPIO
+
+        # Sets the BCM mode for GPIO handling
+        gpio_common.ensure_mode()
 
         # Sets up the pins as outputs
-        GPIO.setup(self._dir_pin, GPIO.OUT)
-        GPIO.setup(self._step_pin, GPIO.OUT)
+        self._gpio.setup(self._dir_bcm, self._gpio.OUT)
+        self._gpio.setup(self._step_bcm, self._gpio.OUT)
+
+        # Maps the GPIO registers to drive the pins with direct writes
+        registers = gpio_common.map_registers()
+
+        # Falls back to the GPIO library if registers are not available
+        if registers is None:
+            self._step_set = None
+
+        # Precomputes the register views and the pin bit masks
+        else:
+            self._dir_set = registers.pin_register(GPSET0, self._dir_bcm)
+            self._dir_clr = registers.pin_register(GPCLR0, self._dir_bcm)
+            self._step_set = registers.pin_register(GPSET0, self._step_bcm)
+            self._step_clr = registers.pin_register(GPCLR0, self._step_bcm)
+            self._dir_mask = pin_mask(self._dir_bcm)
+            self._step_mask = pin_mask(self._step_bcm)
+
+            # Replaces the pulse method with the compiled one if available
+            if core_pulse is not None:
+                self.pulse = functools.partial(
+                    core_pulse,
+                    ctypes.addressof(self._step_set),
+                    ctypes.addressof(self._step_clr),
+                    self._step_mask
+                )
 
     def step(self, direction, pause_val):
         """Perform a step in the given direction and pause time.
@@ -73,19 +109,67 @@ class StepperInterface(object):
                 value must be defined in seconds.
         """
         # Sets the direction pin
-        GPIO.output(self._dir_pin, not direction)
+        self.set_direction(direction)
+
+        # Performs the step pulse
+        self.pulse(pause_val)
+
+    def set_direction(self, direction):
+        """Set the moving direction for the following steps.
+
+        Args:
+            direction (bool): sets the moving direction for steps. 'True'
+                for positive axis direction or CCW rotation. 'False'
+                otherwise.
+        """
+        # Writes the registers directly if they are mapped
+        if self._step_set is not None:
+
+            # Sets the direction pin (low for positive direction)
+            if direction:
+                self._dir_clr.value = self._dir_mask
+            else:
+                self._dir_set.value = self._dir_mask
+
+        # Sets the direction pin with the GPIO library otherwise
+        else:
+            self._gpio.output(self._dir_bcm, not direction)
+
+    def pulse(self, pause_val):
+        """Perform a step pulse in the current direction.
+
+        Args:
+            pause_val (float): sets the pause time value for step. Pause
+                value must be defined in seconds.
+        """
+        # Writes the registers directly if they are mapped
+        if self._step_set is not None:
+
+            # Drives the output pin to high
+            self._step_set.value = self._step_mask
+
+            # Waits for signal to be asserted
+            precise_wait(pause_val)
+
+            # Drives the output pin to low
+            self._step_clr.value = self._step_mask
+
+            # Waits for signal to be asserted
+            precise_wait(pause_val)
+
+            return
 
         # Drives the output pin to high
-        GPIO.output(self._step_pin, True)
+        self._gpio.output(self._step_bcm, True)
 
         # Waits for signal to be asserted
-        time.sleep(pause_val)
+        precise_wait(pause_val)
 
         # Drives the output pin to low
-        GPIO.output(self._step_pin, False)
+        self._gpio.output(self._step_bcm, False)
 
         # Waits for signal to be asserted
-        time.sleep(pause_val)
+        precise_wait(pause_val)
 
     @property
     def dir_pin(self):
@@ -0,0 +1,120 @@
+# Copyright (C) 2021 Grupo de Desminado Humanitario (Uniandes)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Precise timing utilities for the GPR-20 axis step pulses."""
+
+import ctypes
+import threading
+import time
+
+import numpy as np
+
+# Imports Numba for compiling the busy-wait loop if available
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Pauses above this value (in seconds) sleep before busy-waiting
+SPIN_THRESHOLD = 1e-3
+
+# Time (in seconds) left for busy-waiting after sleeping on long pauses
+SLEEP_SLACK = 5e-4
+
+
+# Compiles the busy-wait loop so that it runs without holding the GIL
+if numba is not None:
+
+    # Declares the C library clock by symbol name, so the compiled loop
+    # can be cached on disk
+    _clock_gettime = numba.types.ExternalFunction(
+        "clock_gettime",
+        numba.types.int32(numba.types.int32, numba.types.voidptr))
+
+    # Matches the 'timespec' fields width of the platform
+    _TIMESPEC_DTYPE = np.int64 if ctypes.sizeof(ctypes.c_long) == 8 \
+        else np.int32
+
+    # Clock used by 'time.perf_counter_ns' on Linux
+    _CLOCK_MONOTONIC = time.CLOCK_MONOTONIC
+
+    @numba.njit(nogil=True, cache=True)
+    def _spin_clock(deadline, timespec):
+        """Busy-wait until the monotonic clock reaches the deadline.
+
+        Args:
+            deadline (int): deadline in nanoseconds of
+                'time.perf_counter_ns'.
+            timespec (numpy.ndarray): buffer for the clock value.
+        """
+        now = 0
+        while now < deadline:
+            _clock_gettime(_CLOCK_MONOTONIC, timespec.ctypes.data)
+            now = np.int64(timespec[0]) * 1000000000 + timespec[1]
+
+    # Keeps a clock buffer for each thread that busy-waits
+    _local = threading.local()
+
+    def _spin_until(deadline):
+        """Busy-wait until the monotonic clock reaches the deadline.
+
+        Args:
+            deadline (int): deadline in nanoseconds of
+                'time.perf_counter_ns'.
+        """
+        # Allocates the clock buffer on the first wait of the thread
+        try:
+            timespec = _local.timespec
+        except AttributeError:
+            timespec = _local.timespec = np.zeros(2, _TIMESPEC_DTYPE)
+
+        _spin_clock(deadline, timespec)
+
+    # Compiles or loads the loop now instead of on the first step
+    _spin_until(0)
+
+# Busy-waits on the interpreter if Numba is not available
+else:
+
+    def _spin_until(deadline):
+        """Busy-wait until the monotonic clock reaches the deadline.
+
+        Args:
+            deadline (int): deadline in nanoseconds of
+                'time.perf_counter_ns'.
+        """
+        while time.perf_counter_ns() < deadline:
+            pass
+
+
+def precise_wait(pause_val):
+    """Wait for the given time using a busy-wait for the last fraction.
+
+    Sleeping alone has a jitter in the order of the scheduler granularity,
+    so short pauses are busy-waited entirely and long pauses sleep until
+    'SLEEP_SLACK' seconds before the deadline and busy-wait the rest.
+
+    Args:
+        pause_val (float): pause time value in seconds.
+    """
+    # Calculates the deadline before sleeping
+    deadline = time.perf_counter_ns() + int(pause_val * 1e9)
+
+    # Sleeps most of the pause if it is long enough
+    if pause_val > SPIN_THRESHOLD:
+        time.sleep(pause_val - SLEEP_SLACK)
+
+    # Busy-waits until the deadline
+    _spin_until(deadline)
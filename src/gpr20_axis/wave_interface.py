@@ -0,0 +1,211 @@
+# Copyright (C) 2021 Grupo de Desminado Humanitario (Uniandes)
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Hardware-timed stepper motor interface for GPR-20 robot."""
+
+# Imports the Python standard time library
+import time
+
+import numpy as np
+
+# Imports the pigpio library if available
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+from gpr20_axis import gpio_common
+from gpr20_axis.gpio_registers import board_to_bcm
+
+# Steps included on each waveform sent to the pigpio daemon
+WAVE_CHUNK_STEPS = 1000
+
+# Pause time (in seconds) between checks of the waveform transmission
+WAVE_POLL_PAUSE = 1e-3
+
+
+class WaveInterface(object):
+    """Hardware-timed interface for stepper motor.
+
+    This class clocks out the step pulses of a whole movement through the
+    pigpio daemon, which generates them with DMA so their timing does not
+    depend on the Python process. Movements are split in waveforms of
+    'WAVE_CHUNK_STEPS' steps, and each waveform is queued while the
+    previous one is being transmitted.
+
+    Attributes:
+        dir_pin (int): direction pin for stepper motor driver. Must be defined
+            according to Raspberry Pi 4 board numbering.
+        step_pin (int): step pin for stepper motor driver. Must be defined
+            according to Raspberry Pi 4 board numbering.
+    """
+
+    def __init__(self, dir_pin, step_pin):
+        """Initialize class with the direction and step pins.
+
+        Args:
+            dir_pin (int): pin number for connecting the direction signal of
+                stepper motor driver. Must be defined according to Raspberry
+                Pi 4 board numbering.
+            step_pin (int): pin number for connecting the step signal of
+                stepper motor driver. Must be defined according to Raspberry
+                Pi 4 board numbering.
+
+        Raises:
+            OSError: if the pigpio library is not installed, the pigpio
+                daemon is not running or direct access to the pins has been
+                disabled by 'gpio_common.install'.
+        """
+        # Checks that pigpio library is installed
+        if pigpio is None:
+            raise OSError("pigpio library is not installed")
+
+        # Leaves every pin access to the installed GPIO library
+        if not gpio_common.direct_access():
+            raise OSError("direct GPIO access is disabled")
+
+        # Stores the step and direction pins as class attributes
+        self._dir_pin = dir_pin
+        self._step_pin = step_pin
+
+        # Stores the pins in BCM numbering used by pigpio
+        self._dir_bcm = board_to_bcm(self._dir_pin)
+        self._step_bcm = board_to_bcm(self._step_pin)
+        self._step_mask = 1 << self._step_bcm
+
+        # Connects to the pigpio daemon
+        self._pi = pigpio.pi(show_errors=False)
+        if not self._pi.connected:
+            self._pi.stop()
+            raise OSError("pigpio daemon is not running")
+
+        # Sets up the pins as outputs
+        self._pi.set_mode(self._dir_bcm, pigpio.OUTPUT)
+        self._pi.set_mode(self._step_bcm, pigpio.OUTPUT)
+
+        # Removes any waveform left by a previous connection
+        self._pi.wave_clear()
+
+    def move(self, direction, n_steps, steps_cb, progress_cb):
+        """Perform every step of a movement in the given direction.
+
+        The pause values are requested one waveform at a time, so memory
+        use does not grow with the movement length.
+
+        Args:
+            direction (bool): sets the moving direction for steps. 'True'
+                for positive axis direction or CCW rotation. 'False'
+                otherwise.
+            n_steps (int): step count of the movement.
+            steps_cb (callable): called with the start and stop indexes of
+                the steps of each waveform. Returns a 'numpy.ndarray' with
+                their pause time values, defined in seconds.
+            progress_cb (callable): called with the executed steps count
+                each time a waveform finishes.
+
+        Raises:
+            OSError: if the pigpio daemon fails during the movement. Any
+                waveform on transmission is stopped.
+        """
+        # Stops the movement if the pigpio daemon fails
+        try:
+            self._send_waves(direction, n_steps, steps_cb, progress_cb)
+        except pigpio.error as error:
+            self._stop_waves()
+            raise OSError(str(error))
+
+    def _send_waves(self, direction, n_steps, steps_cb, progress_cb):
+        """Send the steps of a movement as consecutive waveforms.
+
+        Args:
+            direction (bool): sets the moving direction for steps.
+            n_steps (int): step count of the movement.
+            steps_cb (callable): returns the pause time values of the steps
+                between the given start and stop indexes.
+            progress_cb (callable): called with the executed steps count
+                each time a waveform finishes.
+        """
+        # Sets the direction pin
+        self._pi.write(self._dir_bcm, not direction)
+
+        # Stores the waveform on transmission and the steps it completes
+        previous_wave, previous_steps = None, 0
+
+        # Sends the movement as consecutive waveforms
+        for start in range(0, n_steps, WAVE_CHUNK_STEPS):
+            stop = min(start + WAVE_CHUNK_STEPS, n_steps)
+
+            # Converts the pause values of the waveform to microseconds
+            delays = np.rint(steps_cb(start, stop) * 1e6).astype(np.int64)
+
+            # Defines the high and low pulses for each step
+            pulses = []
+            for delay in delays.tolist():
+                pulses.append(pigpio.pulse(self._step_mask, 0, delay))
+                pulses.append(pigpio.pulse(0, self._step_mask, delay))
+
+            # Creates the waveform
+            self._pi.wave_add_generic(pulses)
+            wave = self._pi.wave_create()
+
+            # Queues the waveform after the one on transmission
+            self._pi.wave_send_using_mode(
+                wave,
+                pigpio.WAVE_MODE_ONE_SHOT_SYNC)
+
+            # Waits for the previous waveform to finish and releases it
+            if previous_wave is not None:
+                self._wait_wave(previous_wave)
+                progress_cb(previous_steps)
+
+            # Stores the queued waveform
+            previous_wave = wave
+            previous_steps = stop
+
+        # Waits for the last waveform to finish
+        if previous_wave is not None:
+            self._wait_wave(previous_wave)
+            progress_cb(previous_steps)
+
+    def _wait_wave(self, wave):
+        """Wait for a waveform transmission to finish and delete it.
+
+        Args:
+            wave (int): identifier of the waveform.
+        """
+        # Polls the pigpio daemon until waveform is not on transmission
+        while self._pi.wave_tx_at() == wave:
+            time.sleep(WAVE_POLL_PAUSE)
+
+        # Releases the waveform resources
+        self._pi.wave_delete(wave)
+
+    def _stop_waves(self):
+        """Stop any waveform transmission and release every waveform."""
+        try:
+            self._pi.wave_tx_stop()
+            self._pi.wave_clear()
+        except (pigpio.error, OSError, IOError):
+            pass
+
+    @property
+    def dir_pin(self):
+        """Return the direction pin for the motor interface."""
+        return self._dir_pin
+
+    @property
+    def step_pin(self):
+        """Return the step pin for the motor interface."""
+        return self._step_pin